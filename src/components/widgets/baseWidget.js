@@ -21,7 +21,34 @@ export const baseWidget = {
     methods: {
         getDivName () {
             return 'pane' + this.name
+        },
+        waitForMessage (fieldname) {
+            let name = fieldname.split('.')[0]
+            this.$eventHub.$emit('loadType', name)
+            return new Promise((resolve) => {
+                // re-checked whenever the worker delivers messages, instead of polling
+                let check = () => {
+                    if (this.state.messages.hasOwnProperty(name)) {
+                        this.$eventHub.$off('messages', check)
+                        this.pendingMessageChecks.delete(check)
+                        resolve()
+                    }
+                }
+                this.pendingMessageChecks.add(check)
+                this.$eventHub.$on('messages', check)
+                check()
+            })
+        }
+    },
+    created () {
+        // checks still waiting for a message type, dropped with the widget
+        this.pendingMessageChecks = new Set()
+    },
+    beforeDestroy () {
+        for (let check of this.pendingMessageChecks) {
+            this.$eventHub.$off('messages', check)
         }
+        this.pendingMessageChecks.clear()
     },
     mounted () {
         const _this = this
@@ -1,5 +1,8 @@
 import {ParamSeeker} from '../tools/paramseeker'
 
+// matches any MSG text that names a vehicle, so unrelated lines are rejected in one pass
+const vehicleKeywords = /arduplane|ardusub|rover|tracker/i
+
 window.radians = function (a) {
     return 0.0174533 * a
 }
@@ -70,24 +73,24 @@ let events = {
 export class DataflashDataExtractor {
     static extractAttitudes (messages) {
         let attitudes = {}
+        let attitudeMsgs = null
         if ('AHR2' in messages) {
-            let attitudeMsgs = messages['AHR2']
-            for (let i in attitudeMsgs.time_boot_ms) {
-                attitudes[parseInt(attitudeMsgs.time_boot_ms[i])] =
-                    [
-                        window.radians(attitudeMsgs.Roll[i]),
-                        window.radians(attitudeMsgs.Pitch[i]),
-                        window.radians(attitudeMsgs.Yaw[i])
-                    ]
-            }
+            attitudeMsgs = messages['AHR2']
         } else if ('ATT' in messages) {
-            let attitudeMsgs = messages['ATT']
-            for (let i in attitudeMsgs.time_boot_ms) {
-                attitudes[parseInt(attitudeMsgs.time_boot_ms[i])] =
+            attitudeMsgs = messages['ATT']
+        }
+        if (attitudeMsgs !== null && attitudeMsgs.time_boot_ms !== undefined) {
+            // walk the columns directly instead of re-resolving them for every sample
+            const time = attitudeMsgs.time_boot_ms
+            const roll = attitudeMsgs.Roll
+            const pitch = attitudeMsgs.Pitch
+            const yaw = attitudeMsgs.Yaw
+            for (let i = 0; i < time.length; i++) {
+                attitudes[parseInt(time[i])] =
                     [
-                        window.radians(attitudeMsgs.Roll[i]),
-                        window.radians(attitudeMsgs.Pitch[i]),
-                        window.radians(attitudeMsgs.Yaw[i])
+                        window.radians(roll[i]),
+                        window.radians(pitch[i]),
+                        window.radians(yaw[i])
                     ]
             }
         }
@@ -178,16 +181,20 @@ export class DataflashDataExtractor {
         if ('MSG' in messages) {
             let msgs = messages['MSG']
             for (let i in msgs.Message) {
-                if (msgs.Message[i].toLowerCase().indexOf('arduplane') > -1) {
+                if (!vehicleKeywords.test(msgs.Message[i])) {
+                    continue
+                }
+                let text = msgs.Message[i].toLowerCase()
+                if (text.indexOf('arduplane') > -1) {
                     return 'airplane'
                 }
-                if (msgs.Message[i].toLowerCase().indexOf('ardusub') > -1) {
+                if (text.indexOf('ardusub') > -1) {
                     return 'submarine'
                 }
-                if (msgs.Message[i].toLowerCase().toLowerCase().indexOf('rover') > -1) {
+                if (text.indexOf('rover') > -1) {
                     return 'boat'
                 }
-                if (msgs.Message[i].toLowerCase().indexOf('tracker') > -1) {
+                if (text.indexOf('tracker') > -1) {
                     return 'tracker'
                 }
             }
@@ -258,19 +265,13 @@ export class DataflashDataExtractor {
                     if (startAltitude === null) {
                         startAltitude = gpsData.Alt[i]
                     }
-                    trajectory.push(
-                        [
-                            gpsData.Lng[i] / 1e7,
-                            gpsData.Lat[i] / 1e7,
-                            gpsData.Alt[i] - startAltitude,
-                            gpsData.time_boot_ms[i]
-                        ]
-                    )
-                    timeTrajectory[gpsData.time_boot_ms[i]] = [
-                        gpsData.Lng[i] / 1e7,
-                        gpsData.Lat[i] / 1e7,
-                        (gpsData.Alt[i] - startAltitude) / 1000,
-                        gpsData.time_boot_ms[i]]
+                    // read and scale each row once, then share the values between both outputs
+                    const lon = gpsData.Lng[i] / 1e7
+                    const lat = gpsData.Lat[i] / 1e7
+                    const alt = gpsData.Alt[i] - startAltitude
+                    const time = gpsData.time_boot_ms[i]
+                    trajectory.push([lon, lat, alt, time])
+                    timeTrajectory[time] = [lon, lat, alt / 1000, time]
                 }
             }
             if (trajectory.length) {
@@ -291,19 +292,12 @@ export class DataflashDataExtractor {
                     if (startAltitude === null) {
                         startAltitude = gpsData.Alt[i]
                     }
-                    trajectory.push(
-                        [
-                            gpsData.Lng[i] * 1e-7,
-                            gpsData.Lat[i] * 1e-7,
-                            gpsData.Alt[i] - startAltitude,
-                            gpsData.time_boot_ms[i]
-                        ]
-                    )
-                    timeTrajectory[gpsData.time_boot_ms[i]] = [
-                        gpsData.Lng[i] * 1e-7,
-                        gpsData.Lat[i] * 1e-7,
-                        (gpsData.Alt[i] - startAltitude) / 1000,
-                        gpsData.time_boot_ms[i]]
+                    const lon = gpsData.Lng[i] * 1e-7
+                    const lat = gpsData.Lat[i] * 1e-7
+                    const alt = gpsData.Alt[i] - startAltitude
+                    const time = gpsData.time_boot_ms[i]
+                    trajectory.push([lon, lat, alt, time])
+                    timeTrajectory[time] = [lon, lat, alt / 1000, time]
                 }
             }
             if (trajectory.length) {
@@ -324,19 +318,12 @@ export class DataflashDataExtractor {
                     if (startAltitude === null) {
                         startAltitude = gpsData.Alt[i]
                     }
-                    trajectory.push(
-                        [
-                            gpsData.Lng[i] / 1e7,
-                            gpsData.Lat[i] / 1e7,
-                            gpsData.Alt[i] - startAltitude,
-                            gpsData.time_boot_ms[i]
-                        ]
-                    )
-                    timeTrajectory[gpsData.time_boot_ms[i]] = [
-                        gpsData.Lng[i] / 1e7,
-                        gpsData.Lat[i] / 1e7,
-                        gpsData.Alt[i] - startAltitude,
-                        gpsData.time_boot_ms[i]]
+                    const lon = gpsData.Lng[i] / 1e7
+                    const lat = gpsData.Lat[i] / 1e7
+                    const alt = gpsData.Alt[i] - startAltitude
+                    const time = gpsData.time_boot_ms[i]
+                    trajectory.push([lon, lat, alt, time])
+                    timeTrajectory[time] = [lon, lat, alt, time]
                 }
             }
             if (trajectory.length) {
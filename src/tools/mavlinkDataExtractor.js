@@ -6,13 +6,13 @@ export class MavlinkDataExtractor {
         let attitudes = {}
         if ('ATTITUDE' in messages) {
             let attitudeMsgs = messages['ATTITUDE']
-            for (let i in attitudeMsgs.time_boot_ms) {
-                attitudes[parseInt(attitudeMsgs.time_boot_ms[i])] =
-                    [
-                        attitudeMsgs.roll[i],
-                        attitudeMsgs.pitch[i],
-                        attitudeMsgs.yaw[i]
-                    ]
+            // walk the columns directly instead of re-resolving them for every sample
+            const time = attitudeMsgs.time_boot_ms
+            const roll = attitudeMsgs.roll
+            const pitch = attitudeMsgs.pitch
+            const yaw = attitudeMsgs.yaw
+            for (let i = 0; i < time.length; i++) {
+                attitudes[parseInt(time[i])] = [roll[i], pitch[i], yaw[i]]
             }
         }
         return attitudes
@@ -103,19 +103,13 @@ export class MavlinkDataExtractor {
                     if (startAltitude === null) {
                         startAltitude = gpsData.relative_alt[i]
                     }
-                    trajectory.push(
-                        [
-                            gpsData.lon[i],
-                            gpsData.lat[i],
-                            gpsData.relative_alt[i] - startAltitude,
-                            gpsData.time_boot_ms[i]
-                        ]
-                    )
-                    timeTrajectory[gpsData.time_boot_ms[i]] = [
-                        gpsData.lon[i],
-                        gpsData.lat[i],
-                        gpsData.relative_alt[i],
-                        gpsData.time_boot_ms[i]]
+                    // read and scale each row once, then share the values between both outputs
+                    const lon = gpsData.lon[i]
+                    const lat = gpsData.lat[i]
+                    const alt = gpsData.relative_alt[i]
+                    const time = gpsData.time_boot_ms[i]
+                    trajectory.push([lon, lat, alt - startAltitude, time])
+                    timeTrajectory[time] = [lon, lat, alt, time]
                 }
             }
             if (trajectory.length) {
@@ -136,19 +130,12 @@ export class MavlinkDataExtractor {
                     if (startAltitude === null) {
                         startAltitude = gpsData.alt[0] / 1000
                     }
-                    trajectory.push(
-                        [
-                            gpsData.lon[i] * 1e-7,
-                            gpsData.lat[i] * 1e-7,
-                            gpsData.alt[i] / 1000 - startAltitude,
-                            gpsData.time_boot_ms[i]
-                        ]
-                    )
-                    timeTrajectory[gpsData.time_boot_ms[i]] = [
-                        gpsData.lon[i] * 1e-7,
-                        gpsData.lat[i] * 1e-7,
-                        gpsData.alt[i] / 1000,
-                        gpsData.time_boot_ms[i]]
+                    const lon = gpsData.lon[i] * 1e-7
+                    const lat = gpsData.lat[i] * 1e-7
+                    const alt = gpsData.alt[i] / 1000
+                    const time = gpsData.time_boot_ms[i]
+                    trajectory.push([lon, lat, alt - startAltitude, time])
+                    timeTrajectory[time] = [lon, lat, alt, time]
                 }
             }
             if (trajectory.length) {
@@ -169,19 +156,12 @@ export class MavlinkDataExtractor {
                     if (startAltitude === null) {
                         startAltitude = gpsData.altitude[0]
                     }
-                    trajectory.push(
-                        [
-                            gpsData.lng[i] * 1e-7,
-                            gpsData.lat[i] * 1e-7,
-                            gpsData.altitude[i] - startAltitude,
-                            gpsData.time_boot_ms[i]
-                        ]
-                    )
-                    timeTrajectory[gpsData.time_boot_ms[i]] = [
-                        gpsData.lng[i] * 1e-7,
-                        gpsData.lat[i] * 1e-7,
-                        gpsData.altitude[i],
-                        gpsData.time_boot_ms[i]]
+                    const lon = gpsData.lng[i] * 1e-7
+                    const lat = gpsData.lat[i] * 1e-7
+                    const alt = gpsData.altitude[i]
+                    const time = gpsData.time_boot_ms[i]
+                    trajectory.push([lon, lat, alt - startAltitude, time])
+                    timeTrajectory[time] = [lon, lat, alt, time]
                 }
             }
             if (trajectory.length) {
@@ -202,19 +182,12 @@ export class MavlinkDataExtractor {
                     if (startAltitude === null) {
                         startAltitude = gpsData.altitude[0]
                     }
-                    trajectory.push(
-                        [
-                            gpsData.lng[i] * 1e-7,
-                            gpsData.lat[i] * 1e-7,
-                            gpsData.altitude[i] - startAltitude,
-                            gpsData.time_boot_ms[i]
-                        ]
-                    )
-                    timeTrajectory[gpsData.time_boot_ms[i]] = [
-                        gpsData.lng[i] * 1e-7,
-                        gpsData.lat[i] * 1e-7,
-                        gpsData.altitude[i],
-                        gpsData.time_boot_ms[i]]
+                    const lon = gpsData.lng[i] * 1e-7
+                    const lat = gpsData.lat[i] * 1e-7
+                    const alt = gpsData.altitude[i]
+                    const time = gpsData.time_boot_ms[i]
+                    trajectory.push([lon, lat, alt - startAltitude, time])
+                    timeTrajectory[time] = [lon, lat, alt, time]
                 }
             }
             if (trajectory.length) {
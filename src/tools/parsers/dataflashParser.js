@@ -66,37 +66,22 @@ const units = {
     '#': 'instance' // instance number for message
 }
 
-function getModeMap (mavType) {
-    let map
-    if ([mavlink.MAV_TYPE_QUADROTOR,
-        mavlink.MAV_TYPE_HELICOPTER,
-        mavlink.MAV_TYPE_HEXAROTOR,
-        mavlink.MAV_TYPE_OCTOROTOR,
-        mavlink.MAV_TYPE_COAXIAL,
-        mavlink.MAV_TYPE_TRICOPTER].includes(mavType)) {
-        map = modeMappingAcm
-    }
-    if (mavType === mavlink.MAV_TYPE_FIXED_WING) {
-        map = modeMappingApm
-    }
-    if (mavType === mavlink.MAV_TYPE_GROUND_ROVER) {
-        map = modeMappingRover
-    }
-    if (mavType === mavlink.MAV_TYPE_ANTENNA_TRACKER) {
-        map = modeMappingTracker
-    }
-    if (mavType === mavlink.MAV_TYPE_SUBMARINE) {
-        map = modeMappingSub
-    }
-    if (map == null) {
-        return null
-    }
-    return map
+// mode table for each vehicle type, built once instead of on every lookup
+const modeMaps = {
+    [mavlink.MAV_TYPE_QUADROTOR]: modeMappingAcm,
+    [mavlink.MAV_TYPE_HELICOPTER]: modeMappingAcm,
+    [mavlink.MAV_TYPE_HEXAROTOR]: modeMappingAcm,
+    [mavlink.MAV_TYPE_OCTOROTOR]: modeMappingAcm,
+    [mavlink.MAV_TYPE_COAXIAL]: modeMappingAcm,
+    [mavlink.MAV_TYPE_TRICOPTER]: modeMappingAcm,
+    [mavlink.MAV_TYPE_FIXED_WING]: modeMappingApm,
+    [mavlink.MAV_TYPE_GROUND_ROVER]: modeMappingRover,
+    [mavlink.MAV_TYPE_ANTENNA_TRACKER]: modeMappingTracker,
+    [mavlink.MAV_TYPE_SUBMARINE]: modeMappingSub
 }
 
-function assignColumn (obj) {
-    var ArrayOfString = obj.split(',')
-    return ArrayOfString
+function getModeMap (mavType) {
+    return modeMaps[mavType] || null
 }
 
 // Converts from degrees to radians.
@@ -124,8 +109,8 @@ export class DataflashParser {
             'Columns': 'Type,Length,Name,Format,Columns'
         }
         this.offset = 0
-        this.msgType = []
-        this.offsetArray = []
+        this.offsetsByType = {}
+        this.typeByName = {'FMT': 128}
         this.totalSize = null
         this.messages = {}
         this.lastPercentage = 0
@@ -133,16 +118,21 @@ export class DataflashParser {
         this.maxPercentageInterval = 0.05
         this.messageTypes = {}
         this.alreadyParsed = []
+        this.modeMap = null
     }
 
     FORMAT_TO_STRUCT (obj) {
         var temp
+        // the column list is fixed for a given format, so split it only once
+        if (obj.columnList === undefined) {
+            obj.columnList = obj.Columns.split(',')
+        }
+        let column = obj.columnList
         var dict = {
             name: obj.Name,
-            fieldnames: obj.Columns.split(',')
+            fieldnames: column
         }
 
-        let column = assignColumn(obj.Columns)
         let low
         let n
         for (let i = 0; i < obj.Format.length; i++) {
@@ -262,14 +252,7 @@ export class DataflashParser {
     }
 
     getMsgType (element) {
-        for (let i = 0; i < this.FMT.length; i++) {
-            if (this.FMT[i] != null) {
-                // eslint-disable-next-line
-                if (this.FMT[i].Name == element) {
-                    return i
-                }
-            }
-        }
+        return this.typeByName[element]
     }
 
     onMessage (message) {
@@ -289,12 +272,12 @@ export class DataflashParser {
     }
 
     messageHasInstances (name) {
-        let type = this.FMT.find(msg => msg !== undefined && msg.Name === name)
+        let type = this.FMT[this.getMsgType(name)]
         return type !== undefined && type.units !== undefined && type.units.indexOf('instance') !== -1
     }
 
     getInstancesFieldName (name) {
-        let type = this.FMT.find(msg => msg !== undefined && msg.Name === name)
+        let type = this.FMT[this.getMsgType(name)]
         if (type.units === undefined) {
             return null
         }
@@ -307,22 +290,21 @@ export class DataflashParser {
             return
         }
         let type = this.getMsgType(name)
+        let offsets = this.offsetsByType[type] || []
         var parsed = []
-        for (var i = 0; i < this.msgType.length; i++) {
-            if (type === this.msgType[i]) {
-                this.offset = this.offsetArray[i]
-                try {
-                    let temp = this.FORMAT_TO_STRUCT(this.FMT[this.msgType[i]])
-                    if (temp['name'] != null) {
-                        parsed.push(this.fixData(temp))
-                    }
-                } catch (e) {
-                    console.log('reached log end?')
-                    console.log(e)
+        for (var i = 0; i < offsets.length; i++) {
+            this.offset = offsets[i]
+            try {
+                let temp = this.FORMAT_TO_STRUCT(this.FMT[type])
+                if (temp['name'] != null) {
+                    parsed.push(this.fixData(temp))
                 }
+            } catch (e) {
+                console.log('reached log end?')
+                console.log(e)
             }
             if (i % 100000 === 0) {
-                let perc = 100 * i / this.msgType.length
+                let perc = 100 * i / offsets.length
                 self.postMessage({percentage: perc})
             }
         }
@@ -335,9 +317,9 @@ export class DataflashParser {
             let instanceField = this.getInstancesFieldName(name)
             let instances = {}
             for (let msg of parsed) {
-                try {
+                if (instances.hasOwnProperty(msg[instanceField])) {
                     instances[msg[instanceField]].push(msg)
-                } catch (e) {
+                } else {
                     instances[msg[instanceField]] = [ msg ]
                 }
             }
@@ -345,6 +327,7 @@ export class DataflashParser {
                 this.fixDataOnce(name)
                 this.simplifyData(name)
                 self.postMessage({messageType: name, messageList: this.messages[name]})
+                this.alreadyParsed.push(name)
                 return parsed
             }
             for (let [index, messages] of Object.entries(instances)) {
@@ -372,25 +355,23 @@ export class DataflashParser {
         if (instanceField === null) {
             return numberOfInstances
         }
-        for (var i = 0; i < this.msgType.length; i++) {
-            if (type === this.msgType[i]) {
-                this.offset = this.offsetArray[i]
-                try {
-                    let temp = this.FORMAT_TO_STRUCT(this.FMT[this.msgType[i]])
-                    if (temp['name'] != null) {
-                        let msg = temp
-                        if (!msg.hasOwnProperty(instanceField)) {
-                            break
-                        }
-                        if ((msg[instanceField] + 1) < numberOfInstances) {
-                            return numberOfInstances
-                        } else {
-                            numberOfInstances = msg[instanceField] + 1
-                        }
+        for (let offset of this.offsetsByType[type] || []) {
+            this.offset = offset
+            try {
+                let temp = this.FORMAT_TO_STRUCT(this.FMT[type])
+                if (temp['name'] != null) {
+                    let msg = temp
+                    if (!msg.hasOwnProperty(instanceField)) {
+                        break
+                    }
+                    if ((msg[instanceField] + 1) < numberOfInstances) {
+                        return numberOfInstances
+                    } else {
+                        numberOfInstances = msg[instanceField] + 1
                     }
-                } catch (e) {
-                    console.log(e)
                 }
+            } catch (e) {
+                console.log(e)
             }
         }
         return numberOfInstances
@@ -424,13 +405,18 @@ export class DataflashParser {
             this.offset += 2
 
             let attribute = this.data.getUint8(this.offset)
-            if (this.FMT[attribute] != null) {
+            // look the format up once per message
+            let format = this.FMT[attribute]
+            if (format != null) {
                 this.offset += 1
-                this.offsetArray.push(this.offset)
-                this.msgType.push(attribute)
+                // index offsets per type so parsing one type does not rescan every message
+                if (!this.offsetsByType.hasOwnProperty(attribute)) {
+                    this.offsetsByType[attribute] = []
+                }
+                this.offsetsByType[attribute].push(this.offset)
                 try {
-                    var value = this.FORMAT_TO_STRUCT(this.FMT[attribute])
-                    if (this.FMT[attribute].Name === 'GPS') {
+                    var value = this.FORMAT_TO_STRUCT(format)
+                    if (format.Name === 'GPS') {
                         this.findTimeBase(value)
                     }
                 } catch (e) {
@@ -446,6 +432,7 @@ export class DataflashParser {
                         'Format': value['Format'],
                         'Columns': value['Columns']
                     }
+                    this.typeByName[value['Name']] = value['Type']
                 }
                 // this.onMessage(value)
             } else {
@@ -462,30 +449,32 @@ export class DataflashParser {
         this.sent = true
     }
 
-    getModeString (cmode) {
-        let mavtype
+    findModeMap () {
         let msgs = this.messages['MSG']
         for (let i in msgs.time_boot_ms) {
             // console.log(msg)
             if (msgs.Message[i].indexOf('ArduPlane') > -1) {
-                mavtype = mavlink.MAV_TYPE_FIXED_WING
-                return getModeMap(mavtype)[cmode]
+                return getModeMap(mavlink.MAV_TYPE_FIXED_WING)
             } else if (msgs.Message[i].indexOf('ArduCopter') > -1) {
-                mavtype = mavlink.MAV_TYPE_QUADROTOR
-                return getModeMap(mavtype)[cmode]
+                return getModeMap(mavlink.MAV_TYPE_QUADROTOR)
             } else if (msgs.Message[i].indexOf('ArduSub') > -1) {
-                mavtype = mavlink.MAV_TYPE_SUBMARINE
-                return getModeMap(mavtype)[cmode]
+                return getModeMap(mavlink.MAV_TYPE_SUBMARINE)
             } else if (msgs.Message[i].indexOf('Rover') > -1) {
-                mavtype = mavlink.MAV_TYPE_GROUND_ROVER
-                return getModeMap(mavtype)[cmode]
+                return getModeMap(mavlink.MAV_TYPE_GROUND_ROVER)
             } else if (msgs.Message[i].indexOf('Tracker') > -1) {
-                mavtype = mavlink.MAV_TYPE_ANTENNA_TRACKER
-                return getModeMap(mavtype)[cmode]
+                return getModeMap(mavlink.MAV_TYPE_ANTENNA_TRACKER)
             }
         }
         console.log('defaulting to quadcopter')
-        return getModeMap(mavlink.MAV_TYPE_QUADROTOR)[cmode]
+        return getModeMap(mavlink.MAV_TYPE_QUADROTOR)
+    }
+
+    getModeString (cmode) {
+        // the vehicle only depends on the MSG text, so resolve its mode table once per log
+        if (this.modeMap === null) {
+            this.modeMap = this.findModeMap()
+        }
+        return this.modeMap[cmode]
     }
 
     fixData (message) {
@@ -577,10 +566,10 @@ export class DataflashParser {
         let messageTypes = {}
         this.parseAtOffset('FMTU')
         this.populateUnits()
-        let typeSet = new Set(this.msgType)
         for (let msg of this.FMT) {
             if (msg) {
-                if (typeSet.has(msg.Type)) {
+                // the built-in FMT entry keeps a string Type until the log redefines it, and was never listed
+                if (typeof msg.Type === 'number' && this.offsetsByType.hasOwnProperty(msg.Type)) {
                     let fields = msg.Columns.split(',')
                     // expressions = expressions.filter(e => e !== 'TimeUS')
                     let complexFields = {}
@@ -636,7 +625,6 @@ export class DataflashParser {
         this.parseAtOffset('NKQ2')
         this.parseAtOffset('XKQ2')
         this.parseAtOffset('PARM')
-        this.parseAtOffset('MSG')
         this.parseAtOffset('STAT')
         this.parseAtOffset('EV')
         let metadata = {
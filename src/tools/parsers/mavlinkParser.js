@@ -23,33 +23,23 @@ let vehicles = {
     29: 'quadcopter' // Dodecarotor
 }
 
+// mode table for each vehicle type, built once instead of on every HEARTBEAT
+const modeMaps = {
+    [mavlink.MAV_TYPE_QUADROTOR]: modeMappingAcm,
+    [mavlink.MAV_TYPE_HELICOPTER]: modeMappingAcm,
+    [mavlink.MAV_TYPE_HEXAROTOR]: modeMappingAcm,
+    [mavlink.MAV_TYPE_OCTOROTOR]: modeMappingAcm,
+    [mavlink.MAV_TYPE_COAXIAL]: modeMappingAcm,
+    [mavlink.MAV_TYPE_TRICOPTER]: modeMappingAcm,
+    [mavlink.MAV_TYPE_FIXED_WING]: modeMappingApm,
+    [mavlink.MAV_TYPE_GROUND_ROVER]: modeMappingRover,
+    [mavlink.MAV_TYPE_SURFACE_BOAT]: modeMappingRover,
+    [mavlink.MAV_TYPE_ANTENNA_TRACKER]: modeMappingTracker,
+    [mavlink.MAV_TYPE_SUBMARINE]: modeMappingSub
+}
+
 function getModeMap (mavType) {
-    let map
-    if ([mavlink.MAV_TYPE_QUADROTOR,
-        mavlink.MAV_TYPE_HELICOPTER,
-        mavlink.MAV_TYPE_HEXAROTOR,
-        mavlink.MAV_TYPE_OCTOROTOR,
-        mavlink.MAV_TYPE_COAXIAL,
-        mavlink.MAV_TYPE_TRICOPTER].includes(mavType)) {
-        map = modeMappingAcm
-    }
-    if (mavType === mavlink.MAV_TYPE_FIXED_WING) {
-        map = modeMappingApm
-    }
-    if ([mavlink.MAV_TYPE_GROUND_ROVER,
-        mavlink.MAV_TYPE_SURFACE_BOAT].includes(mavType)) {
-        map = modeMappingRover
-    }
-    if (mavType === mavlink.MAV_TYPE_ANTENNA_TRACKER) {
-        map = modeMappingTracker
-    }
-    if (mavType === mavlink.MAV_TYPE_SUBMARINE) {
-        map = modeMappingSub
-    }
-    if (map == null) {
-        return null
-    }
-    return map
+    return modeMaps[mavType] || null
 }
 
 function getModeString (mavtype, cmode, basemode) {
@@ -69,11 +59,7 @@ function getModeString (mavtype, cmode, basemode) {
         }
         return 'Unknown'
     }
-    try {
-        return map[cmode]
-    } catch {
-
-    }
+    return map[cmode]
 }
 
 let instance
@@ -174,7 +160,8 @@ export class MavlinkParser {
             }
         }
         instance.messages[name] = mergedData
-        self.postMessage({messages: instance.messages})
+        // only send the type that was just parsed, the main thread already holds the others
+        self.postMessage({messageType: name, messageList: mergedData})
     }
 
     extractStartTime () {
@@ -189,6 +176,8 @@ export class MavlinkParser {
     }
 
     processData (data) {
+        // start the main thread from an empty set, types are then sent one at a time as they are parsed
+        self.postMessage({messages: instance.messages})
         this.mavlinkParser.pushBuffer(Buffer.from(data))
         let availableMessages = this.mavlinkParser.preParse()
         let preparseList = [